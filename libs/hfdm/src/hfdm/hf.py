@@ -1,37 +1,334 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 
+import copy
+import fnmatch
+import functools
+import hashlib
+import json
 import logging
+import os
 import traceback
 
 from pathlib import Path
 import tempfile
 import shutil
+import stat
 import re
-from typing import Generator
-
-import yaml
+from typing import Generator, Iterator
 
-from huggingface_hub import HfApi
-from huggingface_hub.errors import RepositoryNotFoundError
+# yaml and huggingface_hub are heavy to import, they are only imported by the
+# functions needing them
 
 from hfdm.utils import VariableProvider, VariableReplacer
 
 logger = logging.getLogger(__name__)
 
+# Matches placeholders like ${prefix::KEY} or ${KEY}
+# (the prefix ends at the first '::', like split("::", 1) would)
+_PLACEHOLDER_RE = re.compile(r"\$\{(?:(?P<prefix>[^}]*?)::)?(?P<key>[^}]*)\}")
+
+# Characters making a path part a glob pattern rather than a literal name
+_GLOB_META_CHARS = frozenset("*?[]")
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int):
+    """Parse a YAML file, memoized on its resolved path, mtime and size.
+
+    mtime_ns and size are only part of the cache key so that an edited
+    file gets parsed again. The result is shared: callers must copy it
+    before handing it out.
+    """
+    import yaml
+
+    # libyaml C-backed loader when available, much faster than the pure-Python one
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    with open(path, "r", encoding="utf-8") as file:
+        return yaml.load(file, Loader=loader)
+
+
+_COPY_BUFSIZE = 1024 * 1024
+
+# copies are I/O bound and release the GIL, so oversubscribe the CPUs
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+_KERNEL_COPY_FNS = [
+    copy_fn
+    for name, copy_fn in (
+        ("copy_file_range", _copy_file_range),
+        ("sendfile", _sendfile),
+    )
+    if hasattr(os, name)
+]
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy src_fd up to EOF into dst_fd without going through user space.
+
+    Returns False when neither copy_file_range nor sendfile copied anything
+    (unsupported, or files such as /proc ones reporting a 0 size), leaving
+    dst empty and both fds rewound.
+    """
+    blocksize = max(size, _COPY_BUFSIZE)
+    for copy_fn in _KERNEL_COPY_FNS:
+        copied = 0
+        try:
+            # don't trust size, the file may have grown since
+            while n := copy_fn(src_fd, dst_fd, copied, blocksize):
+                copied += n
+        except OSError:
+            copied = 0
+
+        if copied:
+            return True
+
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+
+    return False
+
+
+def _fastcopy(src: str, dst: str) -> str:
+    """Drop-in replacement for shutil.copy2 favouring kernel-side copies."""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    # checked before opening: opening a named pipe would block forever
+    if not stat.S_ISREG(os.stat(src).st_mode):
+        raise shutil.SpecialFileError(f"`{src}` is not a regular file")
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        if not _kernel_copy(fsrc.fileno(), fdst.fileno(), size):
+            shutil.copyfileobj(fsrc, fdst, length=_COPY_BUFSIZE)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _is_valid_folder_name(name: str) -> bool:
+    """Check if a string is a valid folder name (contains only valid characters)."""
+    return _GLOB_META_CHARS.isdisjoint(name)
+
+
+@functools.lru_cache(maxsize=256)
+def _determine_src_root(src_pattern: str) -> Path:
+    """Determine the base replaceable root from the source pattern."""
+    parts = Path(src_pattern).parts
+    root_parts = []
+    for part in parts:
+        if _is_valid_folder_name(part):
+            root_parts.append(part)
+        else:
+            break
+    return Path(*root_parts)
+
+
+def _compile_glob(pattern: str) -> list[re.Pattern | None]:
+    """Translate each part of a glob pattern, None standing for '**'."""
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return [
+        None if part == "**" else re.compile(fnmatch.translate(part), flags)
+        for part in Path(pattern).parts
+    ]
+
+
+def _scandir(path: str) -> list[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []  # unreadable or vanished folder, like Path.glob
+
+
+class _PathEntry:
+    """Minimal os.DirEntry stand-in for a path stat'ed directly."""
+
+    __slots__ = ("__stat", "name", "path")
+
+    def __init__(self, path: str, st: os.stat_result):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.__stat = st
+
+    def is_dir(self) -> bool:
+        return stat.S_ISDIR(self.__stat.st_mode)
+
+    def stat(self) -> os.stat_result:
+        return self.__stat
+
+
+def _dir_entry(path: str) -> _PathEntry | None:
+    """Return an entry for path, or None when it does not exist."""
+    try:
+        return _PathEntry(path, os.stat(path))
+    except OSError:
+        return None
+
+
+def _iter_glob(
+    root: str, segments: list[re.Pattern | None], dirs_only: bool = False
+) -> Iterator[os.DirEntry | _PathEntry]:
+    """scandir based equivalent of Path(root).glob(), yielding DirEntry whose
+    cached type information spares a stat per visited entry.
+
+    dirs_only restricts matches to folders, like a trailing separator does.
+    """
+    seen: set[str] = set()
+
+    def select(path: str, entry: os.DirEntry | _PathEntry | None, idx: int):
+        if idx == len(segments):
+            # only reached through a trailing '**', matching folders
+            if entry is None:
+                entry = _dir_entry(path)
+            if entry is not None and entry.path not in seen:
+                seen.add(entry.path)
+                yield entry
+            return
+
+        segment = segments[idx]
+        if segment is None:
+            # '**': this folder, then every sub folder (symlinks not followed)
+            yield from select(path, entry, idx + 1)
+            for sub in _scandir(path):
+                if sub.is_dir() and not sub.is_symlink():
+                    yield from select(sub.path, sub, idx)
+            return
+
+        last = idx == len(segments) - 1
+        for sub in _scandir(path):
+            if not segment.match(sub.name):
+                continue
+            if last:
+                if (not dirs_only or sub.is_dir()) and sub.path not in seen:
+                    seen.add(sub.path)
+                    yield sub
+            elif sub.is_dir():
+                yield from select(sub.path, sub, idx + 1)
+
+    yield from select(root, None, 0)
+
+
+def _plan_tree(
+    src_dir: str,
+    dst_dir: str,
+    dirs_to_create: set[str],
+    files_to_copy: dict[str, str],
+) -> int:
+    """Collect what shutil.copytree(src_dir, dst_dir) would create and copy.
+
+    Returns the total size of the planned files.
+    """
+    size = 0
+    pending = [(src_dir, dst_dir)]
+    while pending:
+        src, dst = pending.pop()
+        dirs_to_create.add(dst)
+        with os.scandir(src) as it:
+            for entry in it:
+                target = os.path.join(dst, entry.name)
+                if entry.is_dir():
+                    pending.append((entry.path, target))
+                else:
+                    files_to_copy[target] = entry.path
+                    size += entry.stat().st_size
+    return size
+
+
+def _pick_temp_root(required_size: int) -> str | None:
+    """Prefer RAM-backed /dev/shm for temp folders when the content fits
+    comfortably in it, else let tempfile decide."""
+    shm = "/dev/shm"
+    if not os.path.isdir(shm) or not os.access(shm, os.W_OK):
+        return None
+
+    try:
+        available_ram = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGESIZE")
+        # the tmpfs can be much smaller than the RAM (64 MiB in docker)
+        shm_free = shutil.disk_usage(shm).free
+    except (AttributeError, ValueError, OSError):
+        return None
+
+    return shm if required_size < min(available_ram, shm_free) // 2 else None
+
+
+def _tree_fingerprint(root: str) -> str:
+    """Hash (relative path, mtime, size) of every file under root."""
+    entries = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            rel = os.path.relpath(path, root)
+            entries.append(f"{rel}:{st.st_mtime_ns}:{st.st_size}")
+
+    return hashlib.sha256("\n".join(sorted(entries)).encode()).hexdigest()
+
+
+def _sync_state_path(repo_id: str) -> str:
+    """Location of the last synced content fingerprint and commit of a space."""
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_root, "hfdm", repo_id.replace("/", "--") + ".json")
+
+
+def _read_sync_state(state_path: str) -> dict:
+    try:
+        with open(state_path, "r", encoding="utf-8") as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    return state if isinstance(state, dict) else {}
+
+
+def _write_sync_state(state_path: str, tree_hash: str, remote_sha: str | None):
+    try:
+        os.makedirs(os.path.dirname(state_path), exist_ok=True)
+        with open(state_path, "w", encoding="utf-8") as file:
+            json.dump({"tree_hash": tree_hash, "remote_sha": remote_sha}, file)
+    except OSError as e:
+        logger.warning("Unable to update sync state %s: %s", state_path, e)
+
+
+def _clear_sync_state(state_path: str):
+    try:
+        os.remove(state_path)
+    except FileNotFoundError:
+        pass
+
 
 class HuggingFaceSpaceDeployment:
     def __init__(self, deployment_config_yaml_path: Path):
-        # load data
-        with open(deployment_config_yaml_path, "r", encoding="utf-8") as file:
-            self.deployment_data = yaml.safe_load(file)
+        config_path = Path(deployment_config_yaml_path).resolve()
 
-        self.deployment_name = self.deployment_data.get("hf-deploy", {}).get(
-            "name", None
-        )
-        self.deployment_src_root_path = (
-            Path(deployment_config_yaml_path).resolve().parent
+        # load data, copied so that callers can't alter the cached one
+        st = os.stat(config_path)
+        self.deployment_data = copy.deepcopy(
+            _load_yaml_cached(str(config_path), st.st_mtime_ns, st.st_size)
         )
 
+        # every setting lives under the hf-deploy key, resolve it once
+        self.__hf_deploy = self.deployment_data.get("hf-deploy") or {}
+
+        self.deployment_name = self.__hf_deploy.get("name", None)
+        self.deployment_src_root_path = config_path.parent
+
         logger.info(
             "HuggingFace deployment %s loaded from source folder: %s",
             self.deployment_name,
@@ -48,21 +345,34 @@ class HuggingFaceSpaceDeployment:
         Yields:
             Generator[str, None, None]: temp folder path
         """
-        tmpdir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        dirs_to_create, files_to_copy, size = self.__plan_hf_mirror()
+
+        tmpdir_name = tempfile.mkdtemp(dir=_pick_temp_root(size))
         try:
-            tmpdir_name = tmpdir.name
-            self.__prepare_hf_mirror(tmpdir_name)
+            self.__prepare_hf_mirror(tmpdir_name, dirs_to_create, files_to_copy)
 
             yield tmpdir_name
         finally:
-            tmpdir.cleanup()
+            shutil.rmtree(tmpdir_name, ignore_errors=True)
 
-    def __prepare_hf_mirror(self, target_root):
-        """Copy files and directories based on YAML configuration."""
-        yaml_data = self.deployment_data
-        base_path = self.deployment_src_root_path
+    def __plan_hf_mirror(self) -> tuple[set[str], dict[str, str], int]:
+        """Plan the mirror based on YAML configuration.
 
-        content = yaml_data.get("hf-deploy", {}).get("content", [])
+        Returns:
+            tuple[set[str], dict[str, str], int]: directories to create and
+            target -> source files to copy, both relative to the mirror root,
+            and the total size of those files
+        """
+        # plain strings on the per-file hot path, Path is only used to
+        # parse the configured patterns
+        base_str = os.fspath(self.deployment_src_root_path)
+
+        content = self.__hf_deploy.get("content", [])
+
+        dirs_to_create: set[str] = set()
+        # last entry wins when several sources map to the same target
+        files_to_copy: dict[str, str] = {}
+        size = 0
 
         for entry in content:
             src_pattern = entry.get("from")
@@ -73,44 +383,93 @@ class HuggingFaceSpaceDeployment:
             exclude = entry.get("exclude", [])
 
             src_root = self.__determine_src_root(src_pattern)
-            dest_path = Path(target_root) / dest_pattern
+            rel_pattern = os.fspath(Path(src_pattern).relative_to(src_root))
+            if rel_pattern != "." and src_pattern.endswith(("/", os.sep)):
+                # Path drops it, but a trailing separator only matches folders
+                rel_pattern += "/"
+            src_root_str = os.path.normpath(os.path.join(base_str, src_root))
+            dest_str = os.path.normpath(dest_pattern)
+            dest_is_dir = dest_pattern == "" or dest_pattern.endswith("/")
 
             if isinstance(exclude, str):
                 exclude = [exclude]
 
+            # one regex alternation instead of a substring scan per exclude
+            exclude_re = (
+                re.compile("|".join(re.escape(ex) for ex in exclude))
+                if exclude
+                else None
+            )
+
             # Ensure destination exists
-            if dest_pattern.endswith("/"):
-                dest_path.mkdir(parents=True, exist_ok=True)
+            if dest_is_dir:
+                dirs_to_create.add(dest_str)
             else:
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                dirs_to_create.add(os.path.dirname(dest_str))
 
-            for src in base_path.glob(src_pattern):
-                if any(ex in str(src) for ex in exclude):
+            for src_entry in self.__iter_sources(src_root_str, rel_pattern):
+                src = src_entry.path
+                if exclude_re and exclude_re.search(src):
                     continue  # Skip excluded files
 
                 # Compute relative path based on the replaceable root
-                rel_path = src.relative_to(base_path / src_root)
-                target = dest_path / rel_path
+                rel = os.path.relpath(src, src_root_str)
+                target = os.path.normpath(os.path.join(dest_str, rel))
 
-                if src.is_dir():
-                    shutil.copytree(src, target, dirs_exist_ok=True)
+                if src_entry.is_dir():
+                    size += _plan_tree(src, target, dirs_to_create, files_to_copy)
                 else:
-                    shutil.copy2(src, target)
-
-    def __is_valid_folder_name(self, name):
-        """Check if a string is a valid folder name (contains only valid characters)."""
-        return not any(char in name for char in "*?")
+                    if rel == "." and dest_is_dir:
+                        # literal file copied into a folder keeps its name
+                        target = os.path.normpath(
+                            os.path.join(dest_str, os.path.basename(src))
+                        )
+                    dirs_to_create.add(os.path.dirname(target))
+                    files_to_copy[target] = src
+                    size += src_entry.stat().st_size
+
+        return dirs_to_create, files_to_copy, size
+
+    def __prepare_hf_mirror(
+        self, target_root, dirs_to_create: set[str], files_to_copy: dict[str, str]
+    ):
+        """Copy planned files and directories under target_root."""
+        # create the whole tree at once, then stream file copies
+        for d in sorted(dirs_to_create):
+            os.makedirs(os.path.join(target_root, d), exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            futures = [
+                executor.submit(_fastcopy, src, os.path.join(target_root, target))
+                for target, src in files_to_copy.items()
+            ]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            for future in done:
+                future.result()  # re-raise the first copy error, if any
+
+    def __iter_sources(
+        self, src_root: str, rel_pattern: str
+    ) -> Iterator[os.DirEntry | _PathEntry]:
+        """Glob rel_pattern anchored at its literal root, so that only the
+        matching subtree gets listed."""
+        if rel_pattern == ".":
+            # pure literal path, nothing to glob
+            src_entry = _dir_entry(src_root)
+            if src_entry is not None:
+                yield src_entry
+            return
+
+        yield from _iter_glob(
+            src_root,
+            _compile_glob(rel_pattern),
+            dirs_only=rel_pattern.endswith(("/", os.sep)),
+        )
 
     def __determine_src_root(self, src_pattern):
         """Determine the base replaceable root from the source pattern."""
-        parts = Path(src_pattern).parts
-        root_parts = []
-        for part in parts:
-            if self.__is_valid_folder_name(part):
-                root_parts.append(part)
-            else:
-                break
-        return Path(*root_parts)
+        return _determine_src_root(src_pattern)
 
     def compute_secrets(self, replacer: VariableReplacer = None):
         """
@@ -119,7 +478,7 @@ class HuggingFaceSpaceDeployment:
             'custom': custom_lookup,        # Lookup for custom:: prefix
         }
         """
-        raw_secrets = self.deployment_data.get("hf-deploy", {}).get("secrets", {})
+        raw_secrets = self.__hf_deploy.get("secrets", {})
 
         return self.__compute_variables(raw_secrets, replacer)
 
@@ -130,7 +489,7 @@ class HuggingFaceSpaceDeployment:
             'custom': custom_lookup,        # Lookup for custom:: prefix
         }
         """
-        raw_env = self.deployment_data.get("hf-deploy", {}).get("environment", {})
+        raw_env = self.__hf_deploy.get("environment", {})
 
         computed = self.__compute_variables(raw_env, replacer)
 
@@ -144,47 +503,67 @@ class HuggingFaceSpaceDeployment:
             logger.warning("No variable provider, returning raw secrets")
             return variables
 
-        computed = {}
-        for key, value in variables.items():
-            # Check if the value has any placeholders like ${prefix::KEY}
-            new_value = re.sub(
-                r"\${(.*?)}",
-                lambda match: self.__replace_value_placeholders(
-                    match.group(1), replacer
-                ),
-                value,
-            )
-            computed[key] = new_value
+        def replace(match: re.Match) -> str | None:
+            prefix = match["prefix"]
+            if prefix is not None:
+                return replacer.lookup(prefix, match["key"])
 
-        return computed
+            # try a default lookup
+            return replacer.lookup_default(match["key"])
 
-    def __replace_value_placeholders(self, value, replacer):
-        # Split the placeholder into prefix and key based on '::'
-        parts = value.split("::", 1)
+        computed = {}
+        for key, value in variables.items():
+            # Literal values (no '$' at all) don't need any substitution
+            if not isinstance(value, str) or "$" not in value:
+                computed[key] = value
+                continue
 
-        if len(parts) == 2:
-            prefix, key = parts
-            return replacer.lookup(prefix, key)
+            # Replace placeholders like ${prefix::KEY} or ${KEY}
+            computed[key] = _PLACEHOLDER_RE.sub(replace, value)
 
-        # try a default lookup
-        return replacer.lookup_default(key)
+        return computed
 
 
 class HuggingFaceAccount:
     # The repo_id is your namespace followed by the repository name: username_or_org/repo_name.
     def __init__(self, namespace: str, token: str):
+        from huggingface_hub import HfApi
+
         self.namespace = namespace
         self.hf_api = HfApi(token=token)
+        self.__repo_ids: dict[str, str] = {}
+        self.__deployed_repos: set[str] | None = None
+
+    def prefetch_deployed_repos(self) -> set[str]:
+        """List the namespace spaces in a single call, before a batch of
+        installs, so that is_repo_deployed does not need a round-trip per repo.
+
+        The listing is a snapshot: only its positive answers are trusted,
+        until clear_deployed_repos is called at the end of the batch.
+        """
+        self.__deployed_repos = {
+            space.id.split("/", 1)[1]
+            for space in self.hf_api.list_spaces(author=self.namespace)
+        }
+        return self.__deployed_repos
+
+    def clear_deployed_repos(self):
+        """Forget the prefetched listing, back to a check per repo"""
+        self.__deployed_repos = None
 
     def is_repo_deployed(self, repo_name: str):
-        """Use special environment variable"""
+        """Check the space exists, from the prefetched listing when any"""
+        if self.__deployed_repos is not None and repo_name in self.__deployed_repos:
+            return True
+
+        # not prefetched, or missing from the listing (private, created since)
         repo_id = self.__repo_id(repo_name)
-        try:
-            _ = self.hf_api.get_space_variables(repo_id)
+        if self.hf_api.repo_exists(repo_id, repo_type="space"):
+            if self.__deployed_repos is not None:
+                self.__deployed_repos.add(repo_name)
             return True
-        except RepositoryNotFoundError:
-            logger.error("Space %s not found!", repo_id)
 
+        logger.error("Space %s not found!", repo_id)
         return False
 
     def __dict_to_space_key_value(self, variables: dict):
@@ -211,6 +590,9 @@ class HuggingFaceAccount:
 
         logger.info("Repo %s URL is: %s", repo_name, repo_url)
 
+        if self.__deployed_repos is not None:
+            self.__deployed_repos.add(repo_name)
+
         # api.add_space_secret(repo_id=repo_id, key="HF_TOKEN", value="hf_api_***")
         # api.add_space_variable(repo_id=repo_id, key="MODEL_REPO_ID", value="user/repo")
 
@@ -218,18 +600,49 @@ class HuggingFaceAccount:
         # space_variables
         return repo_url
 
-    def __update_space_content(self, repo_name, content_root_path):
-        self.hf_api.upload_folder(
+    def __update_space_content(
+        self, repo_name, content_root_path, skip_unchanged: bool = True
+    ):
+        repo_id = self.__repo_id(repo_name)
+        state_path = _sync_state_path(repo_id)
+        tree_hash = _tree_fingerprint(content_root_path)
+
+        if skip_unchanged and self.__is_space_in_sync(repo_id, state_path, tree_hash):
+            logger.info("Space %s content unchanged, skipping upload", repo_name)
+            return
+
+        commit_info = self.hf_api.upload_folder(
             folder_path=content_root_path,
-            repo_id=self.__repo_id(repo_name),
+            repo_id=repo_id,
             repo_type="space",
         )
 
+        _write_sync_state(state_path, tree_hash, getattr(commit_info, "oid", None))
+
+    def __is_space_in_sync(self, repo_id, state_path, tree_hash) -> bool:
+        """Local content matches the last upload, and nothing was pushed to
+        the space since (from another host, a CI or the Hub itself)."""
+        state = _read_sync_state(state_path)
+        if state.get("tree_hash") != tree_hash or not state.get("remote_sha"):
+            return False
+
+        return (
+            self.hf_api.repo_info(repo_id, repo_type="space").sha == state["remote_sha"]
+        )
+
     def __terminate_space(self, repo_name):
-        self.hf_api.delete_repo(repo_id=self.__repo_id(repo_name), repo_type="space")
+        repo_id = self.__repo_id(repo_name)
+        self.hf_api.delete_repo(repo_id=repo_id, repo_type="space")
+        _clear_sync_state(_sync_state_path(repo_id))
+
+        if self.__deployed_repos is not None:
+            self.__deployed_repos.discard(repo_name)
 
     def __repo_id(self, repo_name):
-        return f"{self.namespace}/{repo_name}"
+        repo_id = self.__repo_ids.get(repo_name)
+        if repo_id is None:
+            repo_id = self.__repo_ids[repo_name] = f"{self.namespace}/{repo_name}"
+        return repo_id
 
     def install(
         self,
@@ -252,13 +665,19 @@ class HuggingFaceAccount:
                 # 1: create repo
                 self.__create_docker_space(deployment_name, environment, secrets)
 
-                self.__prepare_deployment_and_push_to_hf(deployment)
+                self.__prepare_deployment_and_push_to_hf(
+                    deployment, skip_unchanged=False
+                )
             elif force is True:
                 # re-update env and secrets
                 logger.warning("updating space: %s not implemented", deployment_name)
 
                 # TODO: re-update env and secrets
-                pass
+
+                # forced => always push files
+                self.__prepare_deployment_and_push_to_hf(
+                    deployment, skip_unchanged=False
+                )
             else:
                 # deployed => sync files
                 self.__prepare_deployment_and_push_to_hf(deployment)
@@ -270,10 +689,12 @@ class HuggingFaceAccount:
             logger.debug(traceback.format_exc())
 
     def __prepare_deployment_and_push_to_hf(
-        self, deployment: HuggingFaceSpaceDeployment
+        self, deployment: HuggingFaceSpaceDeployment, skip_unchanged: bool = True
     ):
         with deployment.temp_deployment_folder() as tmpdir:
-            self.__update_space_content(deployment.get_deployment_name(), tmpdir)
+            self.__update_space_content(
+                deployment.get_deployment_name(), tmpdir, skip_unchanged
+            )
 
     def destroy(self, deployment):
         """Destoy provided deployment
@@ -1,6 +1,8 @@
 import os
 import logging
-from typing import Callable, Dict
+import sys
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -12,42 +14,89 @@ class VariableProvider:
         kv_dict: Dict[str, str] = None,
         lookup_fn: Callable[[str], str | None] = None,
     ):
-        self.__name = name.lower()
+        self.__name = sys.intern(name.lower())
         self.__kv_dict = kv_dict
         self.__lookup_fn = lookup_fn
 
+        # bind the lookup strategy once instead of branching on every call
+        self.__lookup: Callable[[str], str | None] = self.__make_lookup()
+
     def get_name(self) -> str:
         return self.__name
 
-    def lookup(self, key: str):
-        value = None
-        if self.__kv_dict:
-            value = self.__kv_dict.get(key)
+    def lookup(self, key: str) -> str | None:
+        return self.__lookup(key)
+
+    def get_lookup_fn(self) -> Callable[[str], str | None]:
+        """Callable equivalent to lookup, without the method indirection
+        unless a subclass overrides lookup."""
+        if type(self).lookup is not VariableProvider.lookup:
+            return self.lookup
+        return self.__lookup
+
+    def __make_lookup(self) -> Callable[[str], str | None]:
+        kv_dict = self.__kv_dict
+        lookup_fn = self.__lookup_fn
+
+        if kv_dict is not None and lookup_fn is not None:
+
+            def lookup(key: str) -> str | None:
+                value = kv_dict.get(key)
+                if value is None:
+                    value = lookup_fn(key)
+                return value
+
+            return lookup
 
-        if value is None and self.__lookup_fn:
-            value = self.__lookup_fn(key)
+        if kv_dict is not None:
+            return kv_dict.get
 
-        return value
+        if lookup_fn is not None:
+            return lookup_fn
+
+        return lambda key: None
 
 
 class VariableReplacer:
     def __init__(self, providers: list[VariableProvider]):
-        self.__lookup_providers = {}
-
         default_provider = VariableProvider("env", lookup_fn=self.__lookup_default)
-        self.__lookup_providers["env"] = default_provider
 
-        for p in providers:
-            self.__lookup_providers[p.get_name()] = p
+        # provider set is fixed from now on: keep name -> lookup only
+        self.__lookup_providers: Mapping[str, Callable[[str], str | None]] = (
+            MappingProxyType(
+                {
+                    p.get_name(): p.get_lookup_fn()
+                    for p in [default_provider, *(providers or [])]
+                }
+            )
+        )
+        self.__warned_providers: set[str] = set()
+        self.__normalized_names: dict[str, str] = {}
 
     def lookup(self, provider: str, key: str) -> str | None:
-        p_name = provider.lower()
-        value_provider = self.__lookup_providers.get(p_name)
+        # provider names are stored lowercase: placeholders usually match as is
+        lookup_fn = self.__lookup_providers.get(provider)
+
+        if lookup_fn is None:
+            p_name = self.__normalized_names.get(provider)
+            if p_name is None:
+                p_name = self.__normalized_names[provider] = sys.intern(
+                    provider.lower()
+                )
+
+            lookup_fn = self.__lookup_providers.get(p_name)
+            if lookup_fn is None:
+                return self.__unknown_provider(p_name, key)
+
+        return lookup_fn(key)  # Use the appropriate lookup method
 
-        if value_provider:
-            return value_provider.lookup(key)  # Use the appropriate lookup method
+    def lookup_default(self, key: str) -> str | None:
+        return self.__lookup_providers["env"](key)
 
-        logger.error("Unknown value provider: %s for key: %s", p_name, key)
+    def __unknown_provider(self, p_name: str, key: str) -> str:
+        if p_name not in self.__warned_providers:
+            self.__warned_providers.add(p_name)
+            logger.error("Unknown value provider: %s for key: %s", p_name, key)
         return f"Unknown provider: {p_name}"
 
     def __lookup_default(self, key: str) -> str | None:
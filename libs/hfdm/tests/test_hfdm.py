@@ -1,8 +1,258 @@
+import os
+import shutil
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
 from hfdm import (
     HuggingFaceAccount,
+    HuggingFaceSpaceDeployment,
+    HuggingFaceVariableProvider,
+    HuggingFaceVariableReplacer,
 )
+from hfdm.hf import _fastcopy, _pick_temp_root
+
+DEPLOYMENT_YAML = """
+hf-deploy:
+  name: test-space
+  content:
+    - from: requirements.txt
+    - from: dags/*
+      to: dags/
+      exclude:
+        - __pycache__
+        - .gitkeep
+    - from: hf.Dockerfile
+      to: Dockerfile
+    - from: app/*
+      to: app/
+  environment:
+    LITERAL: plain value
+    FROM_EXT: ${ext::k1}
+    FROM_ENV: ${env::HFDM_TEST_VAR}
+    FROM_DEFAULT: 'prefix-${HFDM_TEST_VAR}-${ext::k2}'
+"""
+
+
+def _make_deployment(root):
+    files = {
+        "requirements.txt": "pyyaml\n",
+        "hf.Dockerfile": "FROM python\n",
+        "dags/dag1.py": "dag1",
+        "dags/.gitkeep": "",
+        "dags/__pycache__/dag1.pyc": "bytecode",
+        "dags/sub/dag2.py": "dag2",
+        "app/main.py": "main",
+        "other/ignored.txt": "ignored",
+    }
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+    config = root / "hf-deploy.yaml"
+    config.write_text(DEPLOYMENT_YAML)
+    return HuggingFaceSpaceDeployment(config)
+
+
+def _list_files(root):
+    return {
+        os.path.relpath(os.path.join(dirpath, name), root)
+        for dirpath, _, filenames in os.walk(root)
+        for name in filenames
+    }
 
 
 def test_hfdm_module():
     hf_account = HuggingFaceAccount("TEST-NAMESPACE", "TOKEN")
     assert hf_account is not None
+
+
+def test_is_repo_deployed():
+    hf_account = HuggingFaceAccount("TEST-NAMESPACE", "TOKEN")
+
+    with (
+        mock.patch.object(
+            hf_account.hf_api,
+            "list_spaces",
+            return_value=[SimpleNamespace(id="TEST-NAMESPACE/listed")],
+        ) as list_spaces,
+        mock.patch.object(
+            hf_account.hf_api,
+            "repo_exists",
+            side_effect=lambda repo_id, **_: repo_id == "TEST-NAMESPACE/private",
+        ) as repo_exists,
+    ):
+        # no batch: a single existence check per repo
+        assert hf_account.is_repo_deployed("listed") is False
+        assert hf_account.is_repo_deployed("private") is True
+        list_spaces.assert_not_called()
+        assert repo_exists.call_count == 2
+
+        # batch: listed spaces are answered from the snapshot
+        hf_account.prefetch_deployed_repos()
+        assert hf_account.is_repo_deployed("listed") is True
+        assert hf_account.is_repo_deployed("private") is True
+        assert hf_account.is_repo_deployed("missing") is False
+        list_spaces.assert_called_once_with(author="TEST-NAMESPACE")
+        assert repo_exists.call_count == 4
+
+        # end of batch: the snapshot is no longer trusted
+        hf_account.clear_deployed_repos()
+        assert hf_account.is_repo_deployed("listed") is False
+
+
+def test_deployment_mirror(tmp_path):
+    deployment = _make_deployment(tmp_path)
+
+    assert deployment.get_deployment_name() == "test-space"
+
+    with deployment.temp_deployment_folder() as tmpdir:
+        assert _list_files(tmpdir) == {
+            "requirements.txt",
+            "Dockerfile",
+            "dags/dag1.py",
+            "dags/sub/dag2.py",
+            "app/main.py",
+        }
+        with open(os.path.join(tmpdir, "Dockerfile")) as f:
+            assert f.read() == "FROM python\n"
+
+    assert not os.path.exists(tmpdir)
+
+
+def test_install_skips_unchanged_content(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    deployment = _make_deployment(tmp_path / "src")
+    hf_account = HuggingFaceAccount("TEST-NAMESPACE", "TOKEN")
+    remote = SimpleNamespace(sha=None)
+
+    def upload_folder(**_):
+        remote.sha = f"commit-{upload.call_count}"
+        return SimpleNamespace(oid=remote.sha)
+
+    with (
+        mock.patch.object(hf_account, "is_repo_deployed", return_value=True),
+        mock.patch.object(
+            hf_account.hf_api, "upload_folder", side_effect=upload_folder
+        ) as upload,
+        mock.patch.object(
+            hf_account.hf_api,
+            "repo_info",
+            side_effect=lambda *_, **__: SimpleNamespace(sha=remote.sha),
+        ),
+    ):
+        assert hf_account.install(deployment, []) is True
+        assert hf_account.install(deployment, []) is True
+        assert upload.call_count == 1
+
+        # local change
+        (tmp_path / "src" / "app" / "main.py").write_text("main v2")
+        assert hf_account.install(deployment, []) is True
+        assert upload.call_count == 2
+
+        # pushed from somewhere else
+        remote.sha = "other-commit"
+        assert hf_account.install(deployment, []) is True
+        assert upload.call_count == 3
+
+        # forced
+        assert hf_account.install(deployment, [], force=True) is True
+        assert upload.call_count == 4
+
+
+@mock.patch.dict(os.environ, {"HFDM_TEST_VAR": "env_value"})
+def test_compute_environment(tmp_path):
+    deployment = _make_deployment(tmp_path)
+    vp = HuggingFaceVariableProvider("ext", kv_dict={"k1": "v1", "k2": "v2"})
+
+    assert deployment.compute_environment(HuggingFaceVariableReplacer([vp])) == {
+        "LITERAL": "plain value",
+        "FROM_EXT": "v1",
+        "FROM_ENV": "env_value",
+        "FROM_DEFAULT": "prefix-env_value-v2",
+    }
+
+
+def test_temp_root_respects_shm_free_space():
+    with (
+        mock.patch("os.path.isdir", return_value=True),
+        mock.patch("os.access", return_value=True),
+        mock.patch("os.sysconf", side_effect=lambda name: 1024 * 1024),
+        mock.patch(
+            "shutil.disk_usage",
+            return_value=SimpleNamespace(free=64 * 1024 * 1024),
+        ),
+    ):
+        assert _pick_temp_root(10 * 1024 * 1024) == "/dev/shm"
+        assert _pick_temp_root(100 * 1024 * 1024) is None
+
+
+def test_deployment_mirror_dirs_only(tmp_path):
+    for rel in ("dags/top.py", "dags/sub/s.py"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+
+    config = tmp_path / "hf-deploy.yaml"
+    config.write_text(
+        "hf-deploy:\n  name: dirs-only\n  content:\n    - from: dags/*/\n      to: out/\n"
+    )
+
+    with HuggingFaceSpaceDeployment(config).temp_deployment_folder() as tmpdir:
+        assert _list_files(tmpdir) == {"out/sub/s.py"}
+
+
+def test_deployment_data_not_shared(tmp_path):
+    deployment = _make_deployment(tmp_path)
+    env = deployment.compute_environment()
+    env["LITERAL"] = "mutated"
+
+    other = HuggingFaceSpaceDeployment(tmp_path / "hf-deploy.yaml")
+    assert other.compute_environment()["LITERAL"] == "plain value"
+
+
+def test_fastcopy(tmp_path):
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"x" * (3 * 1024 * 1024 + 7))
+
+    assert _fastcopy(str(src), str(tmp_path / "dst.bin")) == str(tmp_path / "dst.bin")
+    assert (tmp_path / "dst.bin").read_bytes() == src.read_bytes()
+
+    # 0 reported size but actual content
+    if os.path.exists("/proc/version"):
+        _fastcopy("/proc/version", str(tmp_path / "version"))
+        with open("/proc/version", "rb") as f:
+            assert (tmp_path / "version").read_bytes() == f.read()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_fastcopy_rejects_fifo(tmp_path):
+    fifo = tmp_path / "fifo"
+    os.mkfifo(fifo)
+
+    with pytest.raises(shutil.SpecialFileError):
+        _fastcopy(str(fifo), str(tmp_path / "dst"))
+
+
+@mock.patch.dict(os.environ, {"A:B::C": "env_value"})
+def test_compute_environment_placeholder_split(tmp_path):
+    config = tmp_path / "hf-deploy.yaml"
+    config.write_text(
+        "hf-deploy:\n"
+        "  name: split\n"
+        "  environment:\n"
+        "    FIRST_SEP: ${a:b::c}\n"
+        "    EMPTY_PREFIX: ${::KEY}\n"
+    )
+    vp = HuggingFaceVariableProvider("a:b", kv_dict={"c": "v"})
+
+    computed = HuggingFaceSpaceDeployment(config).compute_environment(
+        HuggingFaceVariableReplacer([vp])
+    )
+
+    assert computed == {
+        "FIRST_SEP": "v",
+        "EMPTY_PREFIX": "Unknown provider: ",
+    }
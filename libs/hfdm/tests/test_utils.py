@@ -86,3 +86,38 @@ def test_variable_replacer():
     assert vr.lookup("ext", "k") is None
     assert vr.lookup("ext", "k1") == "ext_v1"
     assert vr.lookup("ext", "k2") == "ext_v2"
+
+
+def test_variable_replacer_unknown_provider():
+    vr = VariableReplacer(None)
+
+    assert vr.lookup("nope", "k1") == "Unknown provider: nope"
+    assert vr.lookup("NOPE", "k2") == "Unknown provider: nope"
+
+
+@mock.patch.dict(os.environ, {"K1": "env_v1"})
+def test_variable_replacer_lookup_default():
+    vr = VariableReplacer([])
+
+    assert vr.lookup_default("K1") == "env_v1"
+    assert vr.lookup_default("K2") is None
+
+
+def test_variable_replacer_provider_case():
+    vp_test = VariableProvider("Ext", kv_dict={"k1": "ext_v1"})
+
+    vr = VariableReplacer([vp_test])
+
+    assert vr.lookup("ext", "k1") == "ext_v1"
+    assert vr.lookup("EXT", "k1") == "ext_v1"
+    assert vr.lookup("Ext", "k1") == "ext_v1"
+
+
+def test_variable_provider_subclass():
+    class UpperProvider(VariableProvider):
+        def lookup(self, key: str):
+            return key.upper()
+
+    vr = VariableReplacer([UpperProvider("upper", kv_dict={"k1": "v1"})])
+
+    assert vr.lookup("upper", "k1") == "K1"